@@ -2,7 +2,6 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from republica_facil.autenticacao import schema, service
@@ -29,7 +28,6 @@ OAuth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
 @router.post(
     '/login/',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=TokenJWT,
 )
 def login_for_access_token(session: T_Session, form_data: OAuth2Form):
@@ -3,15 +3,14 @@
 from http import HTTPStatus
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 import republica_facil.autenticacao.router as router_module
 import republica_facil.autenticacao.service as service_module
-from republica_facil.database import get_session, redis_client
-from republica_facil.main import app
+import republica_facil.security as security_module
+from republica_facil.database import redis_client
 from republica_facil.model.models import User, table_registry
 from republica_facil.security import (
     create_access_token,
@@ -36,20 +35,6 @@ def session():
         yield session
 
 
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
-
-    def get_session_override():
-        return session
-
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
-
-    app.dependency_overrides.clear()
-
-
 @pytest.fixture
 def user(session):
     """Cria um usuário de teste."""
@@ -173,6 +158,30 @@ def test_login_case_sensitive_username(client, user):
     assert 'Incorrect email or password' in response.json()['detail']
 
 
+def test_verify_password_caches_only_positive_results(monkeypatch):
+    """Acerto recente não repete o Argon2; erro e entrada expirada, sim."""
+    hashed = get_password_hash('Senha@123')
+    assert verify_password('Senha@123', hashed)
+
+    calls = []
+
+    def verify_spy(plain_password, hashed_password):
+        calls.append(plain_password)
+        return False
+
+    monkeypatch.setattr(security_module.pwd_context, 'verify', verify_spy)
+
+    assert verify_password('Senha@123', hashed)
+    assert not verify_password('Errada@123', hashed)
+    assert calls == ['Errada@123']
+
+    expired = security_module.monotonic() + 61
+    monkeypatch.setattr(security_module, 'monotonic', lambda: expired)
+
+    assert not verify_password('Senha@123', hashed)
+    assert calls == ['Errada@123', 'Senha@123']
+
+
 def test_forgot_password_success(client, user):
     """Testa solicitação de código de reset para email existente."""
     response = client.post(
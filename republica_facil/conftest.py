@@ -1,34 +1,73 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
+from republica_facil import security
 from republica_facil.database import get_session
 from republica_facil.main import app
-from republica_facil.model.models import User, table_registry
-from republica_facil.security import get_password_hash
+from republica_facil.model.models import (
+    Membro,
+    Quarto,
+    Republica,
+    User,
+    table_registry,
+)
+from republica_facil.security import create_access_token, get_password_hash
 
 
-@pytest.fixture
-def client(session):
-    def get_session_override():
-        return session
+@pytest.fixture(scope='session', autouse=True)
+def _fast_password_hash():
+    # Argon2 com custo mínimo: os hashes continuam válidos para o
+    # verify_password, mas custam microssegundos em vez de ~150 ms cada
+    fast_context = PasswordHash((
+        Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),
+    ))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(security, 'pwd_context', fast_context)
+        yield
+
+
+_SESSION_CTX: ContextVar[Session] = ContextVar('test_session')
+
+
+def _get_session_override():
+    return _SESSION_CTX.get()
+
+
+@pytest.fixture(scope='session')
+def _test_client():
+    # Instalado uma única vez: cada teste troca apenas a sessão da ContextVar
+    app.dependency_overrides[get_session] = _get_session_override
 
     with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
         yield client
 
-    app.dependency_overrides.clear()
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture
+def client(session, _test_client):
+    token = _SESSION_CTX.set(session)
+    yield _test_client
+    _SESSION_CTX.reset(token)
 
 
 @pytest.fixture(scope='session')
 def engine():
     with PostgresContainer('postgres:16', driver='psycopg') as postgres:
         _engine = create_engine(postgres.get_connection_url())
+        # Tabelas criadas uma vez; o isolamento fica com a fixture session
+        table_registry.metadata.create_all(_engine)
 
         with _engine.begin():
             yield _engine
@@ -36,13 +75,22 @@ def engine():
 
 @pytest.fixture
 def session(engine):
-    table_registry.metadata.create_all(engine)
+    # Cada teste roda numa transação externa desfeita no teardown; os commits
+    # do teste e das rotas viram SAVEPOINTs, sem recriar tabelas por teste.
+    # As sequences do Postgres não voltam no rollback, então os ids não
+    # recomeçam em 1 a cada teste: compare com o id lido do objeto ou do banco
+    with engine.connect() as connection:
+        transaction = connection.begin()
 
-    with Session(engine) as session:
-        yield session
-        session.rollback()
+        with Session(
+            bind=connection,
+            join_transaction_mode='create_savepoint',
+            expire_on_commit=False,
+            autoflush=False,
+        ) as session:
+            yield session
 
-    table_registry.metadata.drop_all(engine)
+        transaction.rollback()
 
 
 @contextmanager
@@ -65,6 +113,14 @@ def mock_db_time():
     return _mock_db_time
 
 
+@pytest.fixture
+def unique_email():
+    def _unique_email(prefix='user'):
+        return f'{prefix}-{uuid4().hex}@example.com'
+
+    return _unique_email
+
+
 @pytest.fixture
 def user(session):
     user = User(
@@ -102,3 +158,69 @@ def token(user, client):
         data={'username': user.email, 'password': 'testpass123'},
     )
     return response.json()['access_token']
+
+
+def seed_republica_with_two_rooms_and_two_members(session):
+    """Cria um usuário dono de uma república com dois quartos e dois membros.
+
+    O primeiro membro ocupa o primeiro quarto; o segundo quarto e o segundo
+    membro ficam livres. Retorna o token do dono e os IDs criados.
+    """
+    user = User(
+        fullname='Dono Republica Seed',
+        email=f'seed-{uuid4().hex}@example.com',
+        password=get_password_hash('Senha@123'),
+        telephone='11999999999',
+    )
+    session.add(user)
+    session.flush()
+
+    republica = Republica(
+        nome='República Teste',
+        cep='12345678',
+        rua='Rua Teste',
+        numero='123',
+        bairro='Centro',
+        cidade='São Paulo',
+        estado='SP',
+        user_id=user.id,
+    )
+    session.add(republica)
+    session.flush()
+
+    quarto1 = Quarto(numero=101, republica_id=republica.id)
+    quarto2 = Quarto(numero=102, republica_id=republica.id)
+    session.add_all([quarto1, quarto2])
+    session.flush()
+
+    membro1 = Membro(
+        fullname='Membro Um Teste',
+        email='membro1@example.com',
+        telephone='11988888888',
+        republica_id=republica.id,
+        quarto_id=quarto1.id,
+    )
+    membro2 = Membro(
+        fullname='Membro Dois Teste',
+        email='membro2@example.com',
+        telephone='11977777777',
+        republica_id=republica.id,
+    )
+    session.add_all([membro1, membro2])
+    session.commit()
+
+    return {
+        'token': create_access_token(
+            data={'sub': user.email}, user_id=user.id
+        ),
+        'republica_id': republica.id,
+        'quarto1_id': quarto1.id,
+        'quarto2_id': quarto2.id,
+        'membro1_id': membro1.id,
+        'membro2_id': membro2.id,
+    }
+
+
+@pytest.fixture
+def seeded_republica(session):
+    return seed_republica_with_two_rooms_and_two_members(session)
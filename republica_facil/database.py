@@ -1,14 +1,21 @@
 import redis
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
 
 from republica_facil.settings import Settings
 
 engine = create_engine(Settings().DATABASE_URL)  # pragma: no cover
 
 
+# Sem expirar no commit, os atributos seguem acessíveis sem novo SELECT;
+# sem autoflush, as consultas não disparam flush implícito dos pendentes
+SessionLocal = sessionmaker(  # pragma: no cover
+    engine, expire_on_commit=False, autoflush=False
+)
+
+
 def get_session():  # pragma: no cover
-    with Session(engine) as session:  # pragma: no cover
+    with SessionLocal() as session:  # pragma: no cover
         yield session  # pragma: no cover
 
 
@@ -2,7 +2,6 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -36,7 +35,6 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 @router.post(
     '/{republica_id}',
     status_code=HTTPStatus.CREATED,
-    response_class=JSONResponse,
     response_model=DespesaPublic,
 )
 def create_despesa(
@@ -77,7 +75,6 @@ def create_despesa(
 @router.get(
     '/{republica_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=DespesaList,
 )
 def read_despesas(republica_id: int, session: T_Session, user: CurrentUser):
@@ -105,7 +102,6 @@ def read_despesas(republica_id: int, session: T_Session, user: CurrentUser):
 @router.get(
     '/{republica_id}/{despesa_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=DespesaPublic,
 )
 def read_despesa(
@@ -142,7 +138,6 @@ def read_despesa(
 @router.patch(
     '/{republica_id}/{despesa_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=DespesaPublic,
 )
 def update_despesa(
@@ -191,7 +186,6 @@ def update_despesa(
 @router.delete(
     '/{republica_id}/{despesa_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def delete_despesa(
@@ -231,7 +225,6 @@ def delete_despesa(
 @router.post(
     '/{republica_id}/{despesa_id}/pagamento',
     status_code=HTTPStatus.CREATED,
-    response_class=JSONResponse,
     response_model=PagamentoPublic,
 )
 def registrar_pagamento(
@@ -344,7 +337,6 @@ def registrar_pagamento(
 @router.get(
     '/{republica_id}/{despesa_id}/pagamentos',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=PagamentoList,
 )
 def listar_pagamentos_despesa(
@@ -4,13 +4,10 @@ from datetime import date, timedelta
 from http import HTTPStatus
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from republica_facil.database import get_session
-from republica_facil.main import app
 from republica_facil.model.models import (
     Despesa,
     Membro,
@@ -38,20 +35,6 @@ def session():
         yield session
 
 
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
-
-    def get_session_override():
-        return session
-
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
-
-    app.dependency_overrides.clear()
-
-
 @pytest.fixture
 def user(session):
     """Cria um usuário de teste."""
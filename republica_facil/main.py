@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from republica_facil.autenticacao import router as auth
 from republica_facil.despesas import router as despesa
@@ -9,7 +10,7 @@ from republica_facil.republicas import router as republica
 from republica_facil.settings import Settings
 from republica_facil.usuarios import router as user
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Configuração de CORS
 app.add_middleware(
@@ -2,9 +2,8 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from fastapi import APIRouter, Body, Depends, HTTPException
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from republica_facil.database import get_session
@@ -14,6 +13,10 @@ from republica_facil.usuarios.schema import Message
 
 from .schema import ListMember, Member, MemberPublic
 
+# Teto de membros por lote; também limita as listas IN de
+# _validate_members_batch
+MAX_BATCH_SIZE = 50
+
 router = APIRouter(prefix='/membros', tags=['membros'])
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -23,7 +26,6 @@ T_Session = Annotated[Session, Depends(get_session)]
 @router.post(
     '/{republica_id}',
     status_code=HTTPStatus.CREATED,
-    response_class=JSONResponse,
     response_model=MemberPublic,
 )
 def create_member(
@@ -114,10 +116,113 @@ def create_member(
     )
 
 
+def _validate_members_batch(
+    session: Session, members: list[Member], republica_id: int
+):
+    """Aplica as regras de create_member ao lote com uma consulta por regra.
+
+    Duplicidades dentro do próprio lote contam como conflito, assim como
+    aconteceria se os membros fossem criados um a um.
+    """
+    emails = [member.email for member in members]
+    if len(set(emails)) < len(emails) or session.scalar(
+        select(Membro.id)
+        .where(Membro.email.in_(emails), Membro.ativo)
+        .limit(1)
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT, detail='Membro ja existe'
+        )
+
+    telephones = [member.telephone for member in members]
+    if len(set(telephones)) < len(telephones) or session.scalar(
+        select(Membro.id)
+        .where(Membro.telephone.in_(telephones), Membro.ativo)
+        .limit(1)
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT, detail='Membro ja existe'
+        )
+
+    quarto_ids = [
+        member.quarto_id for member in members if member.quarto_id is not None
+    ]
+    if not quarto_ids:
+        return
+
+    quartos = dict(
+        session.execute(
+            select(Quarto.id, Quarto.republica_id).where(
+                Quarto.id.in_(quarto_ids)
+            )
+        ).all()
+    )
+    if len(quartos) < len(set(quarto_ids)):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Quarto não encontrado',
+        )
+    if any(dono != republica_id for dono in quartos.values()):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Quarto não pertence a esta república',
+        )
+    if len(set(quarto_ids)) < len(quarto_ids) or session.scalar(
+        select(Membro.id)
+        .where(Membro.quarto_id.in_(quarto_ids), Membro.ativo)
+        .limit(1)
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail='Este quarto já está ocupado',
+        )
+
+
+@router.post(
+    '/{republica_id}/batch',
+    status_code=HTTPStatus.CREATED,
+    response_model=ListMember,
+)
+def create_members_batch(
+    members: Annotated[
+        list[Member], Body(min_length=1, max_length=MAX_BATCH_SIZE)
+    ],
+    session: T_Session,
+    user: CurrentUser,
+    republica_id: int,
+):
+    """Cria vários membros da república com um único INSERT em lote."""
+    db_republica = session.scalar(
+        select(Republica).where(Republica.id == republica_id)
+    )
+
+    if not db_republica:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='Republica nao encontrada'
+        )
+    if db_republica.user_id != user.id:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail='Permissões negadas',
+        )
+
+    _validate_members_batch(session, members, republica_id)
+
+    new_members = session.scalars(
+        insert(Membro).returning(Membro, sort_by_parameter_order=True),
+        [
+            {**member.model_dump(), 'republica_id': republica_id}
+            for member in members
+        ],
+    ).all()
+    session.commit()
+
+    return {'members': new_members}
+
+
 @router.get(
     '/{republica_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=ListMember,
 )
 def read_members(  # noqa: PLR0913, PLR0917
@@ -156,7 +261,6 @@ def read_members(  # noqa: PLR0913, PLR0917
 @router.get(
     '/{republica_id}/{member_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=MemberPublic,
 )
 def read_member(
@@ -193,7 +297,6 @@ def read_member(
 @router.put(
     '/{republica_id}/{member_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=MemberPublic,
 )
 def update_member(  # noqa: PLR1702, PLR0912
@@ -306,7 +409,6 @@ def update_member(  # noqa: PLR1702, PLR0912
 @router.patch(
     '/{republica_id}/{member_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def delete_member(
@@ -3,13 +3,11 @@
 from http import HTTPStatus
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from republica_facil.database import get_session
-from republica_facil.main import app
+from republica_facil.membros.router import MAX_BATCH_SIZE
 from republica_facil.model.models import (
     Despesa,
     Membro,
@@ -38,20 +36,6 @@ def session():
         yield session
 
 
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
-
-    def get_session_override():
-        return session
-
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
-
-    app.dependency_overrides.clear()
-
-
 @pytest.fixture
 def user(session):
     """Cria um usuário de teste."""
@@ -362,6 +346,72 @@ def test_create_member_duplicate_telephone(client, token, republica, membro):
     assert 'Membro ja existe' in response.json()['detail']
 
 
+def test_create_members_batch_duplicate_email(client, token, republica):
+    """Testa lote com o mesmo email repetido entre os membros."""
+    members_data = [
+        {
+            'fullname': 'Primeiro Membro',
+            'email': 'repetido@example.com',
+            'telephone': '11966666666',
+        },
+        {
+            'fullname': 'Segundo Membro',
+            'email': 'repetido@example.com',
+            'telephone': '11955555555',
+        },
+    ]
+
+    response = client.post(
+        f'/membros/{republica.id}/batch',
+        json=members_data,
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert 'Membro ja existe' in response.json()['detail']
+
+
+def test_create_members_batch_too_large(client, token, republica):
+    """Testa lote acima do limite de membros por requisição."""
+    members_data = [
+        {
+            'fullname': f'Membro {i}',
+            'email': f'membro{i}@example.com',
+            'telephone': f'119{i:08d}',
+        }
+        for i in range(MAX_BATCH_SIZE + 1)
+    ]
+
+    response = client.post(
+        f'/membros/{republica.id}/batch',
+        json=members_data,
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_create_members_batch_quarto_ocupado(client, token, republica, membro):
+    """Testa lote com membro em quarto já ocupado."""
+    members_data = [
+        {
+            'fullname': 'Novo Membro',
+            'email': 'novo@example.com',
+            'telephone': '11966666666',
+            'quarto_id': membro.quarto_id,
+        }
+    ]
+
+    response = client.post(
+        f'/membros/{republica.id}/batch',
+        json=members_data,
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert 'Este quarto já está ocupado' in response.json()['detail']
+
+
 def test_create_member_without_token(client, republica):
     """Testa criação de membro sem token de autenticação."""
     member_data = {
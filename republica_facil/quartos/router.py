@@ -1,9 +1,9 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from fastapi import APIRouter, Body, Depends, HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from republica_facil.database import get_session
@@ -18,6 +18,9 @@ from .schema import (
     QuartoSchema,
 )
 
+# Teto de quartos por requisição em /quartos/batch
+MAX_BATCH_SIZE = 50
+
 router = APIRouter(prefix='/quartos', tags=['quartos'])
 
 T_Session = Annotated[Session, Depends(get_session)]
@@ -27,7 +30,6 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 @router.post(
     '/',
     status_code=HTTPStatus.CREATED,
-    response_class=JSONResponse,
     response_model=QuartoPublic,
 )
 def create_quarto(
@@ -60,10 +62,58 @@ def create_quarto(
         )
 
 
+@router.post(
+    '/batch',
+    status_code=HTTPStatus.CREATED,
+    response_model=QuartoList,
+)
+def create_quartos_batch(
+    quartos: Annotated[
+        list[QuartoSchema], Body(min_length=1, max_length=MAX_BATCH_SIZE)
+    ],
+    session: T_Session,
+    user: CurrentUser,
+    republica_id: int,
+):
+    """Cria vários quartos da república com um único INSERT em lote."""
+    db_republica = session.scalar(
+        select(Republica).where(Republica.id == republica_id)
+    )
+
+    if not db_republica:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='Republica nao encontrada'
+        )
+    if db_republica.user_id != user.id:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail='Permissões negadas',
+        )
+
+    try:
+        rows = session.execute(
+            insert(Quarto).returning(
+                Quarto.id, Quarto.numero, sort_by_parameter_order=True
+            ),
+            [
+                {'numero': quarto.numero, 'republica_id': republica_id}
+                for quarto in quartos
+            ],
+        ).mappings()
+        novos = [{**row, 'membros': []} for row in rows]
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT, detail='Quarto ja existe'
+        )
+
+    return {'quartos': novos}
+
+
 @router.get(
     '/',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=QuartoList,
 )
 def read_quartos(session: T_Session, user: CurrentUser, republica_id: int):
@@ -97,7 +147,6 @@ def read_quartos(session: T_Session, user: CurrentUser, republica_id: int):
 @router.get(
     '/{quarto_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=QuartoPublic,
 )
 def read_quarto(
@@ -133,7 +182,6 @@ def read_quarto(
 @router.patch(
     '/{quarto_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=QuartoPublic,
 )
 def update_quarto(
@@ -177,7 +225,6 @@ def update_quarto(
 @router.delete(
     '/{quarto_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def delete_quarto(
@@ -230,7 +277,6 @@ def delete_quarto(
 @router.patch(
     '/{quarto_id}/membros',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def adicionar_membro_ao_quarto(
@@ -291,7 +337,6 @@ def adicionar_membro_ao_quarto(
 @router.patch(
     '/{quarto_id}/desocupar',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def desocupar_membro_do_quarto(
@@ -346,7 +391,6 @@ def desocupar_membro_do_quarto(
 @router.delete(
     '/{quarto_id}/membros/{membro_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def remover_membro_do_quarto(  # noqa: PLR0913
@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import object_session
 
 from republica_facil.model.models import Membro, Quarto, Republica, User
+from republica_facil.quartos.router import MAX_BATCH_SIZE
 from republica_facil.security import get_password_hash
 
 
@@ -124,6 +125,48 @@ def test_create_quarto_unauthorized(client, token, republica, other_user):
     assert response.json()['detail'] == 'Permissões negadas'
 
 
+def test_create_quartos_batch_numero_duplicado(
+    client, token, republica, quarto
+):
+    response = client.post(
+        '/quartos/batch',
+        params={'republica_id': republica.id},
+        json=[{'numero': 2}, {'numero': quarto.numero}],
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()['detail'] == 'Quarto ja existe'
+
+
+def test_create_quartos_batch_too_large(client, token, republica):
+    response = client.post(
+        '/quartos/batch',
+        params={'republica_id': republica.id},
+        json=[{'numero': numero} for numero in range(MAX_BATCH_SIZE + 1)],
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_create_quartos_batch_unauthorized(
+    client, token, republica, other_user
+):
+    response_other = client.post(
+        '/auth/login/',
+        data={'username': 'otheruser@test.com', 'password': 'OtherPass123!'},
+    )
+    other_token = response_other.json()['access_token']
+
+    response = client.post(
+        '/quartos/batch',
+        params={'republica_id': republica.id},
+        json=[{'numero': 2}],
+        headers={'Authorization': f'Bearer {other_token}'},
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()['detail'] == 'Permissões negadas'
+
+
 def test_list_quartos_success(client, token, republica, quarto):
     response = client.get(
         '/quartos/',
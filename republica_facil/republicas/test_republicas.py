@@ -3,14 +3,11 @@
 from http import HTTPStatus
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 import republica_facil.republicas.repository as repo_module
-from republica_facil.database import get_session
-from republica_facil.main import app
 from republica_facil.model.models import Republica, User, table_registry
 from republica_facil.republicas import repository
 from republica_facil.republicas.schema import RepublicaCreate
@@ -31,20 +28,6 @@ def session():
         yield session
 
 
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
-
-    def get_session_override():
-        return session
-
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
-
-    app.dependency_overrides.clear()
-
-
 @pytest.fixture
 def user(session):
     """Cria um usuário de teste."""
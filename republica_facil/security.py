@@ -1,5 +1,10 @@
+import hmac
+import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from http import HTTPStatus
+from threading import Lock
+from time import monotonic
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
@@ -8,6 +13,7 @@ from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import DecodeError, decode, encode
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -16,7 +22,17 @@ from republica_facil.model.models import User
 from republica_facil.settings import Settings
 
 settings = Settings()
-pwd_context = PasswordHash.recommended()
+# Argon2id via argon2-cffi (libargon2 nativa) nos parâmetros mínimos da OWASP;
+# hashes antigos seguem verificando, pois levam os próprios parâmetros
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=2,
+        memory_cost=19456,
+        parallelism=1,
+        hash_len=32,
+        salt_len=16,
+    ),
+))
 
 T_Session = Annotated[Session, Depends(get_session)]
 
@@ -50,8 +66,42 @@ def get_password_hash(password: str):
     return pwd_context.hash(password)
 
 
+# Verificações positivas recentes: (HMAC da senha, hash) -> expiração
+_VERIFIED_TTL_SECONDS = 60
+_VERIFIED_MAX_SIZE = 1024
+_verified: OrderedDict[tuple[bytes, str], float] = OrderedDict()
+_verified_lock = Lock()
+# Chave própria do cache, gerada por processo: não reutiliza a SECRET_KEY
+_VERIFIED_KEY = secrets.token_bytes(32)
+
+
 def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verifica a senha, poupando o Argon2 em acertos repetidos.
+
+    Só resultados positivos entram no cache, por no máximo 60 segundos, e a
+    senha nunca é guardada em claro: a chave é um HMAC com _VERIFIED_KEY.
+    """
+    key = (
+        hmac.new(_VERIFIED_KEY, plain_password.encode(), 'sha256').digest(),
+        hashed_password,
+    )
+    now = monotonic()
+
+    with _verified_lock:
+        expires_at = _verified.pop(key, None)
+        if expires_at is not None and expires_at > now:
+            _verified[key] = expires_at
+            return True
+
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+
+    with _verified_lock:
+        _verified[key] = now + _VERIFIED_TTL_SECONDS
+        if len(_verified) > _VERIFIED_MAX_SIZE:
+            _verified.popitem(last=False)
+
+    return True
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='auth/login')
@@ -23,7 +23,7 @@ def test_create_user(session, mock_db_time):
         )
 
         assert asdict(user) == {
-            'id': 1,
+            'id': new_user.id,
             'fullname': 'Test User',
             'email': 'testuser@example.com',
             'password': 'secret',
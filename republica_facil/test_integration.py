@@ -3,20 +3,17 @@
 from http import HTTPStatus
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from republica_facil.database import get_session
-from republica_facil.main import app
 from republica_facil.model.models import (
     Membro,
     Pagamento,
-    User,
     table_registry,
 )
-from republica_facil.security import get_password_hash
+
+pytestmark = pytest.mark.slow
 
 
 @pytest.fixture
@@ -33,25 +30,11 @@ def session():
         yield session
 
 
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
-
-    def get_session_override():
-        return session
-
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
-
-    app.dependency_overrides.clear()
-
-
 class TestFluxoCompletoRepublica:
     """Testa o fluxo completo de criação e gerenciamento de uma república."""
 
     def test_fluxo_completo_criar_e_gerenciar_republica(  # noqa: PLR0915, PLR0914, PLR6301
-        self, client, session
+        self, client, session, unique_email
     ):
         """
         Testa o fluxo completo:
@@ -66,9 +49,10 @@ class TestFluxoCompletoRepublica:
         9. Verificar status da despesa
         """
         # 1. Criar usuário
+        user_email = unique_email('joao')
         user_data = {
             'fullname': 'João Silva',
-            'email': 'joao@example.com',
+            'email': user_email,
             'password': 'Senha@123',
             'telephone': '11999999999',
         }
@@ -77,7 +61,7 @@ class TestFluxoCompletoRepublica:
 
         # 2. Fazer login
         login_data = {
-            'username': 'joao@example.com',
+            'username': user_email,
             'password': 'Senha@123',
         }
         response = client.post('/auth/login', data=login_data)
@@ -231,273 +215,11 @@ class TestFluxoCompletoRepublica:
         assert sum(p['valor_pago'] for p in pagamentos) == expected_total_value
 
 
-class TestFluxoSoftDeleteMembro:
-    """Testa o fluxo de soft delete de membro e preservação de histórico."""
-
-    def test_fluxo_remover_membro_preserva_historico(  # noqa: PLR0914, PLR6301
-        self, client, session
-    ):
-        """
-        Testa o fluxo:
-        1. Criar república com membros
-        2. Criar despesa e registrar pagamento
-        3. Remover membro (soft delete)
-        4. Verificar que histórico de pagamento foi preservado
-        5. Verificar que membro não aparece na listagem ativa
-        6. Verificar que quarto ficou disponível
-        7. Adicionar novo membro no mesmo quarto
-        """
-        # Setup inicial
-        user = User(
-            fullname='Test User',
-            email='test@example.com',
-            password=get_password_hash('Senha@123'),
-            telephone='11999999999',
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-
-        # Login
-        login_data = {'username': 'test@example.com', 'password': 'Senha@123'}
-        response = client.post('/auth/login', data=login_data)
-        token = response.json()['access_token']
-        headers = {'Authorization': f'Bearer {token}'}
-
-        # 1. Criar república
-        republica_data = {
-            'nome': 'República Teste',
-            'cep': '12345678',
-            'rua': 'Rua Teste',
-            'numero': '123',
-            'bairro': 'Centro',
-            'cidade': 'São Paulo',
-            'estado': 'SP',
-        }
-        response = client.post(
-            '/republicas', json=republica_data, headers=headers
-        )
-        republica_id = response.json()['id']
-
-        # 2. Criar quarto
-        quarto_data = {'numero': 101}
-        response = client.post(
-            f'/quartos/?republica_id={republica_id}',
-            json=quarto_data,
-            headers=headers,
-        )
-        quarto_id = response.json()['id']
-
-        # Criar membro
-        membro_data = {
-            'fullname': 'Membro Teste',
-            'email': 'membro@example.com',
-            'telephone': '11988888888',
-            'quarto_id': quarto_id,
-        }
-        response = client.post(
-            f'/membros/{republica_id}', json=membro_data, headers=headers
-        )
-        membro_id = response.json()['id']
-
-        # 2. Criar despesa
-        expected_despesa_value = 100.0
-        despesa_data = {
-            'descricao': 'Conta de Água',
-            'valor_total': expected_despesa_value,
-            'data_vencimento': '2024-01-31',
-            'categoria': 'agua',
-        }
-        response = client.post(
-            f'/despesas/{republica_id}', json=despesa_data, headers=headers
-        )
-        despesa_id = response.json()['id']
-
-        # Registrar pagamento
-        pagamento_data = {'membro_id': membro_id}
-        response = client.post(
-            f'/despesas/{republica_id}/{despesa_id}/pagamento',
-            json=pagamento_data,
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.CREATED
-        pagamento_id = response.json()['id']
-
-        # 3. Remover membro (soft delete)
-        response = client.patch(
-            f'/membros/{republica_id}/{membro_id}', headers=headers
-        )
-        assert response.status_code == HTTPStatus.OK
-
-        # 4. Verificar que histórico foi preservado no banco
-        db_pagamento = session.get(Pagamento, pagamento_id)
-        assert db_pagamento is not None
-        assert db_pagamento.membro_id == membro_id
-        assert db_pagamento.valor_pago == expected_despesa_value
-
-        db_membro = session.get(Membro, membro_id)
-        assert db_membro is not None
-        assert db_membro.ativo is False
-        assert db_membro.data_saida is not None
-
-        # 5. Verificar que membro não aparece na listagem ativa
-        response = client.get(f'/membros/{republica_id}', headers=headers)
-        membros_ativos = response.json()['members']
-        assert len(membros_ativos) == 0
-
-        # Verificar que aparece quando incluir inativos
-        response = client.get(
-            f'/membros/{republica_id}?incluir_inativos=true', headers=headers
-        )
-        todos_membros = response.json()['members']
-        assert len(todos_membros) == 1
-        assert todos_membros[0]['ativo'] is False
-
-        # 6. Verificar que quarto ficou disponível
-        response = client.get(
-            f'/quartos/{quarto_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        quarto = response.json()
-        assert len(quarto['membros']) == 0
-
-        # 7. Adicionar novo membro no mesmo quarto
-        novo_membro_data = {
-            'fullname': 'Novo Membro',
-            'email': 'novo@example.com',
-            'telephone': '11977777777',
-            'quarto_id': quarto_id,
-        }
-        response = client.post(
-            f'/membros/{republica_id}', json=novo_membro_data, headers=headers
-        )
-        assert response.status_code == HTTPStatus.CREATED
-        assert response.json()['quarto_id'] == quarto_id
-
-
-class TestFluxoTransferenciaMembro:
-    """Testa o fluxo de transferência de membro entre quartos."""
-
-    def test_fluxo_transferir_membro_entre_quartos(  # noqa: PLR6301
-        self, client, session
-    ):
-        """
-        Testa o fluxo:
-        1. Criar república com 2 quartos
-        2. Criar membro no quarto 1
-        3. Transferir membro para quarto 2
-        4. Verificar que quarto 1 ficou vazio
-        5. Verificar que quarto 2 está ocupado
-        6. Tentar adicionar outro membro no quarto 2 (deve falhar)
-        """
-        # Setup
-        user = User(
-            fullname='Test User',
-            email='test@example.com',
-            password=get_password_hash('Senha@123'),
-            telephone='11999999999',
-        )
-        session.add(user)
-        session.commit()
-
-        login_data = {'username': 'test@example.com', 'password': 'Senha@123'}
-        response = client.post('/auth/login', data=login_data)
-        token = response.json()['access_token']
-        headers = {'Authorization': f'Bearer {token}'}
-
-        # Criar república
-        republica_data = {
-            'nome': 'República Teste',
-            'cep': '12345678',
-            'rua': 'Rua Teste',
-            'numero': '123',
-            'bairro': 'Centro',
-            'cidade': 'São Paulo',
-            'estado': 'SP',
-        }
-        response = client.post(
-            '/republicas', json=republica_data, headers=headers
-        )
-        republica_id = response.json()['id']
-
-        # 1. Criar 2 quartos
-        response = client.post(
-            f'/quartos/?republica_id={republica_id}',
-            json={'numero': 101},
-            headers=headers,
-        )
-        quarto1_id = response.json()['id']
-
-        response = client.post(
-            f'/quartos/?republica_id={republica_id}',
-            json={'numero': 102},
-            headers=headers,
-        )
-        quarto2_id = response.json()['id']
-
-        # 2. Criar membro no quarto 1
-        membro_data = {
-            'fullname': 'Membro Teste',
-            'email': 'membro@example.com',
-            'telephone': '11988888888',
-            'quarto_id': quarto1_id,
-        }
-        response = client.post(
-            f'/membros/{republica_id}', json=membro_data, headers=headers
-        )
-        membro_id = response.json()['id']
-
-        # 3. Transferir membro para quarto 2
-        update_data = {
-            'fullname': 'Membro Teste',
-            'email': 'membro@example.com',
-            'telephone': '11988888888',
-            'quarto_id': quarto2_id,
-        }
-        response = client.put(
-            f'/membros/{republica_id}/{membro_id}',
-            json=update_data,
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.OK
-        assert response.json()['quarto_id'] == quarto2_id
-
-        # 4. Verificar que quarto 1 ficou vazio
-        response = client.get(
-            f'/quartos/{quarto1_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        quarto1 = response.json()
-        assert len(quarto1['membros']) == 0
-
-        # 5. Verificar que quarto 2 está ocupado
-        response = client.get(
-            f'/quartos/{quarto2_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        quarto2 = response.json()
-        assert len(quarto2['membros']) == 1
-        assert quarto2['membros'][0]['id'] == membro_id
-
-        # 6. Tentar adicionar outro membro no quarto 2 (deve falhar)
-        outro_membro_data = {
-            'fullname': 'Outro Membro',
-            'email': 'outro@example.com',
-            'telephone': '11977777777',
-            'quarto_id': quarto2_id,
-        }
-        response = client.post(
-            f'/membros/{republica_id}', json=outro_membro_data, headers=headers
-        )
-        assert response.status_code == HTTPStatus.CONFLICT
-        assert 'já está ocupado' in response.json()['detail']
-
-
 class TestFluxoMultiplasRepublicas:
     """Testa isolamento entre múltiplas repúblicas."""
 
     def test_isolamento_entre_republicas(  # noqa: PLR0914, PLR6301
-        self, client, session
+        self, client, session, unique_email
     ):
         """
         Testa o fluxo:
@@ -508,9 +230,10 @@ class TestFluxoMultiplasRepublicas:
         5. Verificar que membros e quartos são isolados
         """
         # 1. Criar usuário 1
+        user1_email = unique_email('user1_multiplas')
         user1_data = {
             'fullname': 'Usuario Silva Oliveira',
-            'email': 'user1_multiplas@example.com',
+            'email': user1_email,
             'password': 'Senha@123',
             'telephone': '11991111111',
         }
@@ -519,7 +242,7 @@ class TestFluxoMultiplasRepublicas:
 
         # Login usuário 1
         login1 = {
-            'username': 'user1_multiplas@example.com',
+            'username': user1_email,
             'password': 'Senha@123',
         }
         response = client.post('/auth/login', data=login1)
@@ -540,9 +263,10 @@ class TestFluxoMultiplasRepublicas:
         rep1_id = response.json()['id']
 
         # Criar usuário 2
+        user2_email = unique_email('user2_multiplas')
         user2_data = {
             'fullname': 'Usuario Santos Pereira',
-            'email': 'user2_multiplas@example.com',
+            'email': user2_email,
             'password': 'Senha@123',
             'telephone': '11992222222',
         }
@@ -551,7 +275,7 @@ class TestFluxoMultiplasRepublicas:
 
         # Login usuário 2
         login2 = {
-            'username': 'user2_multiplas@example.com',
+            'username': user2_email,
             'password': 'Senha@123',
         }
         response = client.post('/auth/login', data=login2)
@@ -640,115 +364,220 @@ class TestFluxoMultiplasRepublicas:
         assert len(membros_rep2) == 0  # Nenhum membro criado
 
 
-class TestFluxoDesocuparQuarto:
-    """Testa o fluxo de desocupar quarto."""
-
-    def test_fluxo_desocupar_e_deletar_quarto(  # noqa: PLR6301
-        self, client, session
-    ):
-        """
-        Testa o fluxo:
-        1. Criar república com quarto e membro
-        2. Alocar membro no quarto
-        3. Tentar deletar quarto ocupado (deve falhar)
-        4. Desocupar quarto
-        5. Deletar quarto com sucesso
-        """
-        # Setup
-        user = User(
-            fullname='Test User',
-            email='test@example.com',
-            password=get_password_hash('Senha@123'),
-            telephone='11999999999',
-        )
-        session.add(user)
-        session.commit()
-
-        login_data = {'username': 'test@example.com', 'password': 'Senha@123'}
-        response = client.post('/auth/login', data=login_data)
-        token = response.json()['access_token']
-        headers = {'Authorization': f'Bearer {token}'}
-
-        # Criar república
-        republica_data = {
-            'nome': 'República Teste',
-            'cep': '12345678',
-            'rua': 'Rua Teste',
-            'numero': '123',
-            'bairro': 'Centro',
-            'cidade': 'São Paulo',
-            'estado': 'SP',
-        }
-        response = client.post(
-            '/republicas', json=republica_data, headers=headers
-        )
-        republica_id = response.json()['id']
-
-        # 1. Criar quarto
-        response = client.post(
-            f'/quartos/?republica_id={republica_id}',
-            json={'numero': 101},
-            headers=headers,
-        )
-        quarto_id = response.json()['id']
+def _remover_membro_preserva_historico(client, session, headers, seed):
+    """
+    1. Registrar pagamento de uma despesa pelo membro do quarto 1
+    2. Remover membro (soft delete)
+    3. Verificar que histórico de pagamento foi preservado
+    4. Verificar que membro não aparece na listagem ativa
+    5. Verificar que quarto ficou disponível
+    6. Adicionar novo membro no mesmo quarto
+    """
+    republica_id = seed['republica_id']
+    quarto_id = seed['quarto1_id']
+    membro_id = seed['membro1_id']
+
+    # 1. Criar despesa e registrar pagamento (200 / 2 membros)
+    expected_payment_value = 100.0
+    despesa_data = {
+        'descricao': 'Conta de Água',
+        'valor_total': 200.0,
+        'data_vencimento': '2024-01-31',
+        'categoria': 'agua',
+    }
+    response = client.post(
+        f'/despesas/{republica_id}', json=despesa_data, headers=headers
+    )
+    despesa_id = response.json()['id']
 
-        # Criar membro
-        membro_data = {
-            'fullname': 'Membro Teste',
-            'email': 'membro@example.com',
-            'telephone': '11988888888',
-        }
-        response = client.post(
-            f'/membros/{republica_id}', json=membro_data, headers=headers
-        )
-        membro_id = response.json()['id']
+    response = client.post(
+        f'/despesas/{republica_id}/{despesa_id}/pagamento',
+        json={'membro_id': membro_id},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    pagamento_id = response.json()['id']
 
-        # 2. Alocar membro no quarto
-        response = client.patch(
-            f'/quartos/{quarto_id}/membros',
-            json={'membro_id': membro_id},
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.OK
+    # 2. Remover membro (soft delete)
+    response = client.patch(
+        f'/membros/{republica_id}/{membro_id}', headers=headers
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    # 3. Verificar que histórico foi preservado no banco
+    db_pagamento = session.get(Pagamento, pagamento_id)
+    assert db_pagamento is not None
+    assert db_pagamento.membro_id == membro_id
+    assert db_pagamento.valor_pago == expected_payment_value
+
+    db_membro = session.get(Membro, membro_id)
+    assert db_membro is not None
+    assert db_membro.ativo is False
+    assert db_membro.data_saida is not None
+
+    # 4. Verificar que membro não aparece na listagem ativa
+    response = client.get(f'/membros/{republica_id}', headers=headers)
+    membros_ativos = response.json()['members']
+    assert [m['id'] for m in membros_ativos] == [seed['membro2_id']]
+
+    # Verificar que aparece quando incluir inativos
+    expected_members_count = 2
+    response = client.get(
+        f'/membros/{republica_id}?incluir_inativos=true', headers=headers
+    )
+    todos_membros = response.json()['members']
+    assert len(todos_membros) == expected_members_count
+    removido = next(m for m in todos_membros if m['id'] == membro_id)
+    assert removido['ativo'] is False
+
+    # 5. Verificar que quarto ficou disponível
+    response = client.get(
+        f'/quartos/{quarto_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    assert len(response.json()['membros']) == 0
+
+    # 6. Adicionar novo membro no mesmo quarto
+    novo_membro_data = {
+        'fullname': 'Novo Membro',
+        'email': 'novo@example.com',
+        'telephone': '11966666666',
+        'quarto_id': quarto_id,
+    }
+    response = client.post(
+        f'/membros/{republica_id}', json=novo_membro_data, headers=headers
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()['quarto_id'] == quarto_id
+
+
+def _transferir_membro_entre_quartos(client, session, headers, seed):
+    """
+    1. Transferir membro do quarto 1 para o quarto 2
+    2. Verificar que quarto 1 ficou vazio
+    3. Verificar que quarto 2 está ocupado
+    4. Tentar adicionar outro membro no quarto 2 (deve falhar)
+    """
+    republica_id = seed['republica_id']
+    quarto1_id = seed['quarto1_id']
+    quarto2_id = seed['quarto2_id']
+    membro_id = seed['membro1_id']
+
+    # 1. Transferir membro para quarto 2
+    update_data = {
+        'fullname': 'Membro Um Teste',
+        'email': 'membro1@example.com',
+        'telephone': '11988888888',
+        'quarto_id': quarto2_id,
+    }
+    response = client.put(
+        f'/membros/{republica_id}/{membro_id}',
+        json=update_data,
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['quarto_id'] == quarto2_id
 
-        # 3. Tentar deletar quarto ocupado
-        response = client.delete(
-            f'/quartos/{quarto_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.CONFLICT
-        assert 'ocupado' in response.json()['detail'].lower()
+    # 2. Verificar que quarto 1 ficou vazio
+    response = client.get(
+        f'/quartos/{quarto1_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    assert len(response.json()['membros']) == 0
 
-        # 4. Desocupar quarto
-        response = client.patch(
-            f'/quartos/{quarto_id}/desocupar',
-            json={'membro_id': membro_id},
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.OK
+    # 3. Verificar que quarto 2 está ocupado
+    response = client.get(
+        f'/quartos/{quarto2_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    quarto2 = response.json()
+    assert len(quarto2['membros']) == 1
+    assert quarto2['membros'][0]['id'] == membro_id
+
+    # 4. Tentar adicionar outro membro no quarto 2 (deve falhar)
+    outro_membro_data = {
+        'fullname': 'Outro Membro',
+        'email': 'outro@example.com',
+        'telephone': '11966666666',
+        'quarto_id': quarto2_id,
+    }
+    response = client.post(
+        f'/membros/{republica_id}', json=outro_membro_data, headers=headers
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert 'já está ocupado' in response.json()['detail']
+
+
+def _desocupar_e_deletar_quarto(client, session, headers, seed):
+    """
+    1. Tentar deletar quarto ocupado (deve falhar)
+    2. Desocupar quarto
+    3. Deletar quarto com sucesso
+    """
+    republica_id = seed['republica_id']
+    quarto_id = seed['quarto1_id']
+    membro_id = seed['membro1_id']
+
+    # 1. Tentar deletar quarto ocupado
+    response = client.delete(
+        f'/quartos/{quarto_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert 'ocupado' in response.json()['detail'].lower()
+
+    # 2. Desocupar quarto
+    response = client.patch(
+        f'/quartos/{quarto_id}/desocupar',
+        json={'membro_id': membro_id},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK
 
-        # Verificar que membro não tem mais quarto
-        response = client.get(
-            f'/membros/{republica_id}/{membro_id}', headers=headers
-        )
-        assert response.json()['quarto_id'] is None
+    # Verificar que membro não tem mais quarto
+    response = client.get(
+        f'/membros/{republica_id}/{membro_id}', headers=headers
+    )
+    assert response.json()['quarto_id'] is None
 
-        # 5. Deletar quarto com sucesso
-        response = client.delete(
-            f'/quartos/{quarto_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.OK
+    # 3. Deletar quarto com sucesso
+    response = client.delete(
+        f'/quartos/{quarto_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK
 
-        # Verificar que o quarto foi deletado
-        response = client.get(
-            f'/quartos/{quarto_id}?republica_id={republica_id}',
-            headers=headers,
-        )
+    # Verificar que quarto foi deletado
+    response = client.get(
+        f'/quartos/{quarto_id}?republica_id={republica_id}',
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+class TestFluxosMembroQuarto:
+    """Testa fluxos de membros e quartos sobre uma república já povoada."""
+
+    @pytest.mark.parametrize(
+        'fluxo',
+        [
+            _remover_membro_preserva_historico,
+            _transferir_membro_entre_quartos,
+            _desocupar_e_deletar_quarto,
+        ],
+        ids=[
+            'soft_delete_membro',
+            'transferir_membro',
+            'desocupar_quarto',
+        ],
+    )
+    def test_fluxo_membro_quarto(  # noqa: PLR6301
+        self, client, session, seeded_republica, fluxo
+    ):
+        """
+        Parte de uma república com dois quartos e dois membros (o primeiro
+        alocado no quarto 1) e executa apenas a ação específica do fluxo.
+        """
+        headers = {'Authorization': f'Bearer {seeded_republica["token"]}'}
 
-        # Verificar que quarto foi deletado
-        response = client.get(
-            f'/quartos/{quarto_id}?republica_id={republica_id}',
-            headers=headers,
-        )
-        assert response.status_code == HTTPStatus.NOT_FOUND
+        fluxo(client, session, headers, seeded_republica)
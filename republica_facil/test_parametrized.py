@@ -3,17 +3,16 @@
 from datetime import date
 from http import HTTPStatus
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from republica_facil.database import get_session
-from republica_facil.main import app
 from republica_facil.model.models import (
     Despesa,
     Republica,
+    TipoDespesa,
     User,
     table_registry,
 )
@@ -25,151 +24,197 @@ from republica_facil.usuarios.service import (
 )
 
 
-@pytest.fixture
-def session():
-    """Cria uma sessão de teste."""
+@pytest.fixture(scope='module')
+def engine():
+    """Cria o banco em memória e o schema uma única vez por módulo."""
     engine = create_engine(
         'sqlite:///:memory:',
         connect_args={'check_same_thread': False},
         poolclass=StaticPool,
     )
-    table_registry.metadata.create_all(engine)
-
-    with Session(engine) as session:
-        yield session
-
-
-@pytest.fixture
-def client(session):
-    """Cria um cliente de teste."""
 
-    def get_session_override():
-        return session
+    # pysqlite não emite BEGIN por conta própria; sem isso os SAVEPOINTs
+    # usados pela sessão de teste não funcionam
+    @event.listens_for(engine, 'connect')
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    with TestClient(app) as client:
-        app.dependency_overrides[get_session] = get_session_override
-        yield client
+    @event.listens_for(engine, 'begin')
+    def emit_begin(connection):
+        connection.exec_driver_sql('BEGIN')
 
-    app.dependency_overrides.clear()
+    table_registry.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
-def user(session):
-    """Cria um usuário de teste."""
-    user = User(
-        fullname='Test User Complete',
-        email='testuser@example.com',
-        password=get_password_hash('testpass123'),
-        telephone='11999999999',
-    )
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+def session(engine):
+    """Cria uma sessão de teste desfeita ao final de cada caso."""
+    with engine.connect() as connection:
+        transaction = connection.begin()
+
+        with Session(
+            bind=connection, join_transaction_mode='create_savepoint'
+        ) as session:
+            yield session
+
+        transaction.rollback()
+
+
+@pytest.fixture(scope='session')
+def password_hash():
+    """Gera o hash da senha de teste uma única vez por sessão."""
+    return get_password_hash('testpass123')
+
+
+@pytest.fixture(scope='module')
+def user(engine, password_hash):
+    """Cria o usuário de teste uma única vez por módulo.
+
+    A linha é gravada fora da transação de cada caso, então sobrevive aos
+    rollbacks; o que os testes alteram continua sendo desfeito.
+    """
+    with Session(engine, expire_on_commit=False) as session:
+        user = User(
+            fullname='Test User Complete',
+            email='testuser@example.com',
+            password=password_hash,
+            telephone='11999999999',
+        )
+        session.add(user)
+        session.commit()
+
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def token(user):
     """Cria um token de autenticação."""
     return create_access_token(data={'sub': user.email}, user_id=user.id)
 
 
-@pytest.fixture
-def republica(session, user):
-    """Cria uma república de teste."""
-    republica = Republica(
-        nome='República Teste',
-        cep='12345678',
-        rua='Rua Teste',
-        numero='123',
-        bairro='Centro',
-        cidade='São Paulo',
-        estado='SP',
-        user_id=user.id,
-    )
-    session.add(republica)
-    session.commit()
-    session.refresh(republica)
+@pytest.fixture(scope='module')
+def republica(engine, user):
+    """Cria a república de teste uma única vez por módulo."""
+    with Session(engine, expire_on_commit=False) as session:
+        republica = Republica(
+            nome='República Teste',
+            cep='12345678',
+            rua='Rua Teste',
+            numero='123',
+            bairro='Centro',
+            cidade='São Paulo',
+            estado='SP',
+            user_id=user.id,
+        )
+        session.add(republica)
+        session.commit()
+
     return republica
 
 
+@pytest.fixture(scope='module')
+def despesa_id(engine, republica):
+    """Insere a despesa base das atualizações uma única vez por módulo.
+
+    Usa um INSERT do Core: sem identity map, unit of work nem refresh.
+    """
+    with engine.begin() as connection:
+        return connection.execute(
+            insert(Despesa).returning(Despesa.id),
+            [
+                {
+                    'descricao': 'Conta de Luz',
+                    'valor_total': 200.0,
+                    'data_vencimento': date(2024, 1, 31),
+                    'categoria': TipoDespesa.LUZ,
+                    'republica_id': republica.id,
+                }
+            ],
+        ).scalar_one()
+
+
 # =============================================================================
 # TESTES PARAMETRIZADOS - CRIAÇÃO DE USUÁRIOS
 # =============================================================================
 
 
+# Corpos serializados uma única vez na coleta; cada caso envia os bytes prontos
+JSON_HEADERS = {'content-type': 'application/json'}
+
+CREATE_USER_CASES = [
+    # Caso 1: Usuário válido com dados completos
+    pytest.param(
+        orjson.dumps({
+            'fullname': 'Usuario Teste Silva',
+            'email': 'usuario1@example.com',
+            'password': 'Senha@123',
+            'telephone': '11988888888',
+        }),
+        HTTPStatus.CREATED,
+        None,
+        id='usuario_valido',
+    ),
+    # Caso 2: Usuário com senha fraca
+    pytest.param(
+        orjson.dumps({
+            'fullname': 'Usuario Teste Santos',
+            'email': 'usuario2@example.com',
+            'password': 'senha123',
+            'telephone': '11977777777',
+        }),
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+        'Weak password',
+        id='senha_fraca',
+    ),
+    # Caso 3: Usuário com telefone inválido
+    pytest.param(
+        orjson.dumps({
+            'fullname': 'Usuario Teste Oliveira',
+            'email': 'usuario3@example.com',
+            'password': 'Senha@123',
+            'telephone': '1234567',
+        }),
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+        'Verifies if a phone number is valid',
+        id='telefone_invalido',
+    ),
+    # Caso 4: Usuário com nome incompleto
+    pytest.param(
+        orjson.dumps({
+            'fullname': 'Usuario',
+            'email': 'usuario4@example.com',
+            'password': 'Senha@123',
+            'telephone': '11966666666',
+        }),
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+        'Enter your full name',
+        id='nome_incompleto',
+    ),
+    # Caso 5: Usuário com email inválido
+    pytest.param(
+        orjson.dumps({
+            'fullname': 'Usuario Teste Pereira',
+            'email': 'emailinvalido',
+            'password': 'Senha@123',
+            'telephone': '11955555555',
+        }),
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+        None,  # Pydantic validation
+        id='email_invalido',
+    ),
+]
+
+
 @pytest.mark.parametrize(
-    ('user_data', 'expected_status', 'expected_detail'),
-    [
-        # Caso 1: Usuário válido com dados completos
-        (
-            {
-                'fullname': 'Usuario Teste Silva',
-                'email': 'usuario1@example.com',
-                'password': 'Senha@123',
-                'telephone': '11988888888',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-        # Caso 2: Usuário com senha fraca
-        (
-            {
-                'fullname': 'Usuario Teste Santos',
-                'email': 'usuario2@example.com',
-                'password': 'senha123',
-                'telephone': '11977777777',
-            },
-            HTTPStatus.UNPROCESSABLE_ENTITY,
-            'Weak password',
-        ),
-        # Caso 3: Usuário com telefone inválido
-        (
-            {
-                'fullname': 'Usuario Teste Oliveira',
-                'email': 'usuario3@example.com',
-                'password': 'Senha@123',
-                'telephone': '1234567',
-            },
-            HTTPStatus.UNPROCESSABLE_ENTITY,
-            'Verifies if a phone number is valid',
-        ),
-        # Caso 4: Usuário com nome incompleto
-        (
-            {
-                'fullname': 'Usuario',
-                'email': 'usuario4@example.com',
-                'password': 'Senha@123',
-                'telephone': '11966666666',
-            },
-            HTTPStatus.UNPROCESSABLE_ENTITY,
-            'Enter your full name',
-        ),
-        # Caso 5: Usuário com email inválido
-        (
-            {
-                'fullname': 'Usuario Teste Pereira',
-                'email': 'emailinvalido',
-                'password': 'Senha@123',
-                'telephone': '11955555555',
-            },
-            HTTPStatus.UNPROCESSABLE_ENTITY,
-            None,  # Pydantic validation
-        ),
-    ],
-    ids=[
-        'usuario_valido',
-        'senha_fraca',
-        'telefone_invalido',
-        'nome_incompleto',
-        'email_invalido',
-    ],
+    ('body', 'expected_status', 'expected_detail'), CREATE_USER_CASES
 )
 def test_create_user_parametrized(
-    client, user_data, expected_status, expected_detail
+    client, body, expected_status, expected_detail
 ):
     """Testa criação de usuário com diferentes cenários."""
-    response = client.post('/users', json=user_data)
+    response = client.post('/users', content=body, headers=JSON_HEADERS)
 
     assert response.status_code == expected_status
 
@@ -359,63 +404,23 @@ def test_create_republica_parametrized(
 # =============================================================================
 
 
-@pytest.mark.parametrize(
-    ('quarto_data', 'expected_status', 'should_succeed'),
-    [
-        # Caso 1: Quarto com número baixo
-        (
-            {'numero': 1},
-            HTTPStatus.CREATED,
-            True,
-        ),
-        # Caso 2: Quarto com número médio
-        (
-            {'numero': 101},
-            HTTPStatus.CREATED,
-            True,
-        ),
-        # Caso 3: Quarto com número alto
-        (
-            {'numero': 999},
-            HTTPStatus.CREATED,
-            True,
-        ),
-        # Caso 4: Quarto com número zero
-        (
-            {'numero': 0},
-            HTTPStatus.CREATED,
-            True,
-        ),
-        # Caso 5: Quarto com número negativo
-        (
-            {'numero': -1},
-            HTTPStatus.CREATED,
-            True,
-        ),
-    ],
-    ids=[
-        'numero_baixo',
-        'numero_medio',
-        'numero_alto',
-        'numero_zero',
-        'numero_negativo',
-    ],
-)
-def test_create_quarto_parametrized(  # noqa: PLR0913, PLR0917
-    client, token, republica, quarto_data, expected_status, should_succeed
-):
-    """Testa criação de quarto com diferentes números."""
+# Números baixo, médio, alto, zero e negativo: todos aceitos pela API
+QUARTO_NUMEROS = [1, 101, 999, 0, -1]
+
+
+def test_create_quartos_batch(client, token, republica):
+    """Cria todos os quartos do cenário em uma única requisição em lote."""
     headers = {'Authorization': f'Bearer {token}'}
     response = client.post(
-        f'/quartos/?republica_id={republica.id}',
-        json=quarto_data,
+        f'/quartos/batch?republica_id={republica.id}',
+        json=[{'numero': numero} for numero in QUARTO_NUMEROS],
         headers=headers,
     )
 
-    assert response.status_code == expected_status
-
-    if should_succeed:
-        assert response.json()['numero'] == quarto_data['numero']
+    assert response.status_code == HTTPStatus.CREATED
+    quartos = response.json()['quartos']
+    assert [quarto['numero'] for quarto in quartos] == QUARTO_NUMEROS
+    assert all(quarto['membros'] == [] for quarto in quartos)
 
 
 # =============================================================================
@@ -423,82 +428,53 @@ def test_create_quarto_parametrized(  # noqa: PLR0913, PLR0917
 # =============================================================================
 
 
-@pytest.mark.parametrize(
-    ('membro_data', 'expected_status', 'error_key'),
-    [
-        # Caso 1: Membro válido completo
-        (
-            {
-                'fullname': 'Maria Silva Santos',
-                'email': 'maria@example.com',
-                'telephone': '11988888888',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-        # Caso 2: Membro com nome diferente
-        (
-            {
-                'fullname': 'João Pedro Oliveira',
-                'email': 'joao@example.com',
-                'telephone': '11977777777',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-        # Caso 3: Membro com telefone de área diferente
-        (
-            {
-                'fullname': 'Ana Carolina Souza',
-                'email': 'ana@example.com',
-                'telephone': '21966666666',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-        # Caso 4: Membro com nome composto
-        (
-            {
-                'fullname': 'Carlos Eduardo Mendes',
-                'email': 'carlos@example.com',
-                'telephone': '31955555555',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-        # Caso 5: Membro com sobrenome composto
-        (
-            {
-                'fullname': 'Juliana Alves Costa',
-                'email': 'juliana@example.com',
-                'telephone': '41944444444',
-            },
-            HTTPStatus.CREATED,
-            None,
-        ),
-    ],
-    ids=[
-        'membro_maria',
-        'membro_joao',
-        'telefone_rj',
-        'nome_composto',
-        'sobrenome_composto',
-    ],
-)
-def test_create_membro_parametrized(  # noqa: PLR0913, PLR0917
-    client, token, republica, membro_data, expected_status, error_key
-):
-    """Testa criação de membro com diferentes dados."""
+MEMBROS = [
+    # Membro válido completo
+    {
+        'fullname': 'Maria Silva Santos',
+        'email': 'maria@example.com',
+        'telephone': '11988888888',
+    },
+    # Membro com nome diferente
+    {
+        'fullname': 'João Pedro Oliveira',
+        'email': 'joao@example.com',
+        'telephone': '11977777777',
+    },
+    # Membro com telefone de área diferente
+    {
+        'fullname': 'Ana Carolina Souza',
+        'email': 'ana@example.com',
+        'telephone': '21966666666',
+    },
+    # Membro com nome composto
+    {
+        'fullname': 'Carlos Eduardo Mendes',
+        'email': 'carlos@example.com',
+        'telephone': '31955555555',
+    },
+    # Membro com sobrenome composto
+    {
+        'fullname': 'Juliana Alves Costa',
+        'email': 'juliana@example.com',
+        'telephone': '41944444444',
+    },
+]
+
+
+def test_create_membros_batch(client, token, republica):
+    """Cria todos os membros do cenário em uma única requisição em lote."""
     headers = {'Authorization': f'Bearer {token}'}
     response = client.post(
-        f'/membros/{republica.id}', json=membro_data, headers=headers
+        f'/membros/{republica.id}/batch', json=MEMBROS, headers=headers
     )
 
-    assert response.status_code == expected_status
-
-    if error_key is None:
-        assert response.json()['fullname'] == membro_data['fullname']
-        assert response.json()['email'] == membro_data['email']
+    assert response.status_code == HTTPStatus.CREATED
+    members = response.json()['members']
+    assert [(m['fullname'], m['email']) for m in members] == [
+        (m['fullname'], m['email']) for m in MEMBROS
+    ]
+    assert all(m['ativo'] for m in members)
 
 
 # =============================================================================
@@ -592,118 +568,81 @@ def test_create_despesa_parametrized(  # noqa: PLR0913, PLR0917
 
 
 # =============================================================================
-# TESTES PARAMETRIZADOS - VALIDAÇÃO DE SENHA
+# TESTES DE TABELA - VALIDADORES (funções puras, sem banco)
 # =============================================================================
-
-
-@pytest.mark.parametrize(
-    ('password', 'expected_valid', 'error_message'),
-    [
-        # Caso 1: Senha válida forte
-        ('Senha@123', True, None),
-        # Caso 2: Senha sem caractere especial
-        ('Senha1234', False, 'one special character'),
-        # Caso 3: Senha sem letra maiúscula
-        ('senha@123', False, 'one uppercase letter'),
-        # Caso 4: Senha sem número
-        ('Senha@abc', False, 'one digit'),
-        # Caso 5: Senha muito curta
-        ('Se@1', False, 'at least 8 characters'),
-        # Caso 6: Senha válida com múltiplos caracteres especiais
-        ('S3nh@!For', True, None),
-    ],
-    ids=[
-        'senha_forte',
-        'sem_especial',
-        'sem_maiuscula',
-        'sem_numero',
-        'muito_curta',
-        'multiplos_especiais',
-    ],
-)
-def test_password_validation_parametrized(
-    password,
-    expected_valid,
-    error_message,  # noqa: ARG001
-):
+# Os validadores rodam em microssegundos; um único teste por tabela evita o
+# custo de setup/teardown do pytest por caso. A mensagem do assert mostra a
+# entrada que falhou.
+
+PASSWORD_CASES = [
+    # Senha válida forte
+    ('Senha@123', True),
+    # Senha sem caractere especial
+    ('Senha1234', False),
+    # Senha sem letra maiúscula
+    ('senha@123', False),
+    # Senha sem número
+    ('Senha@abc', False),
+    # Senha muito curta
+    ('Se@1', False),
+    # Senha válida com múltiplos caracteres especiais
+    ('S3nh@!For', True),
+    # Letras circuladas têm caixa mas não são alfanuméricas: contam como
+    # especial
+    ('Abcdefg1ⓐ', True),
+    ('ABCDEFG1ⓐ', True),
+    ('Senhaé12Ⓐx', True),
+]
+
+TELEPHONE_CASES = [
+    # Telefone válido de SP
+    ('11999999999', True),
+    # Telefone válido do RJ
+    ('21988888888', True),
+    # Telefone válido de MG
+    ('31977777777', True),
+    # Telefone muito curto
+    ('119999', False),
+    # Telefone muito longo
+    ('119999999999999', False),
+    # Telefone com 10 dígitos (fixo)
+    ('1199999999', True),
+]
+
+FULLNAME_CASES = [
+    # Nome completo válido
+    ('João Silva Santos', True),
+    # Nome com sobrenome composto
+    ('Maria Silva Costa', True),
+    # Nome simples (inválido)
+    ('João', False),
+    # Nome com sobrenome muito curto
+    ('João Li', False),
+    # Nome válido com três partes
+    ('Ana Paula Oliveira', True),
+    # Nome com duas palavras curtas
+    ('João Da', False),
+    # Espaços duplicados e nas pontas são ignorados
+    ('  João  Silva ', True),
+]
+
+
+def test_password_validation():
     """Testa validação de senha com diferentes padrões."""
-    result = verify_strong_password(password)
-
-    assert result == expected_valid
+    for password, expected_valid in PASSWORD_CASES:
+        assert verify_strong_password(password) == expected_valid, password
 
 
-# =============================================================================
-# TESTES PARAMETRIZADOS - VALIDAÇÃO DE TELEFONE
-# =============================================================================
-
-
-@pytest.mark.parametrize(
-    ('telephone', 'expected_valid'),
-    [
-        # Caso 1: Telefone válido de SP
-        ('11999999999', True),
-        # Caso 2: Telefone válido do RJ
-        ('21988888888', True),
-        # Caso 3: Telefone válido de MG
-        ('31977777777', True),
-        # Caso 4: Telefone muito curto
-        ('119999', False),
-        # Caso 5: Telefone muito longo
-        ('119999999999999', False),
-        # Caso 6: Telefone com 10 dígitos (fixo)
-        ('1199999999', True),
-    ],
-    ids=[
-        'sp_valido',
-        'rj_valido',
-        'mg_valido',
-        'muito_curto',
-        'muito_longo',
-        'fixo_valido',
-    ],
-)
-def test_telephone_validation_parametrized(telephone, expected_valid):
+def test_telephone_validation():
     """Testa validação de telefone com diferentes formatos."""
-    result = verify_length_telephone(telephone)
-
-    assert result == expected_valid
-
-
-# =============================================================================
-# TESTES PARAMETRIZADOS - VALIDAÇÃO DE NOME COMPLETO
-# =============================================================================
+    for telephone, expected_valid in TELEPHONE_CASES:
+        assert verify_length_telephone(telephone) == expected_valid, telephone
 
 
-@pytest.mark.parametrize(
-    ('fullname', 'expected_valid'),
-    [
-        # Caso 1: Nome completo válido
-        ('João Silva Santos', True),
-        # Caso 2: Nome com sobrenome composto
-        ('Maria Silva Costa', True),
-        # Caso 3: Nome simples (inválido)
-        ('João', False),
-        # Caso 4: Nome com sobrenome muito curto
-        ('João Li', False),
-        # Caso 5: Nome válido com três partes
-        ('Ana Paula Oliveira', True),
-        # Caso 6: Nome com duas palavras curtas
-        ('João Da', False),
-    ],
-    ids=[
-        'nome_valido',
-        'sobrenome_composto',
-        'nome_simples',
-        'sobrenome_curto',
-        'tres_partes',
-        'duas_curtas',
-    ],
-)
-def test_fullname_validation_parametrized(fullname, expected_valid):
+def test_fullname_validation():
     """Testa validação de nome completo com diferentes formatos."""
-    result = verify_fullname(fullname)
-
-    assert result == expected_valid
+    for fullname, expected_valid in FULLNAME_CASES:
+        assert verify_fullname(fullname) == expected_valid, fullname
 
 
 # =============================================================================
@@ -782,27 +721,15 @@ def test_update_despesa_parametrized(  # noqa: PLR0913, PLR0917
     client,
     token,
     republica,
-    session,
+    despesa_id,
     update_data,
     field_to_check,
     expected_value,
 ):
     """Testa atualização de despesa com diferentes campos."""
-    # Criar despesa inicial
-    despesa = Despesa(
-        descricao='Conta de Luz',
-        valor_total=200.0,
-        data_vencimento=date(2024, 1, 31),
-        categoria='luz',
-        republica_id=republica.id,
-    )
-    session.add(despesa)
-    session.commit()
-    session.refresh(despesa)
-
     headers = {'Authorization': f'Bearer {token}'}
     response = client.patch(
-        f'/despesas/{republica.id}/{despesa.id}',
+        f'/despesas/{republica.id}/{despesa_id}',
         json=update_data,
         headers=headers,
     )
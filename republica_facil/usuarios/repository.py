@@ -1,30 +1,39 @@
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.orm import Session
 
 from republica_facil.model.models import User
 
 
-def get_user_by_email(session: Session, email: str) -> User | None:
-    return session.scalar(select(User).where(User.email == email))
+def email_exists(session: Session, email: str) -> bool:
+    # Só o literal 1: basta o índice de email, sem ler colunas da linha
+    stmt = select(literal(1)).where(User.email == email).limit(1)
+    return session.scalar(stmt) is not None
 
 
-def get_user_by_telephone(session: Session, telephone: str) -> User | None:
-    return session.scalar(select(User).where(User.telephone == telephone))
-
-
-def get_user_by_id(session: Session, user_id: int) -> User | None:
-    return session.scalar(select(User).where(User.id == user_id))
+def get_user_by_id(session: Session, user_id: int) -> dict | None:
+    # Mesma projeção de get_users: sem hash de senha e sem o selectin de
+    # republicas que carregar a entidade User dispararia
+    stmt = select(User.id, User.fullname, User.email, User.telephone).where(
+        User.id == user_id
+    )
+    row = session.execute(stmt).mappings().first()
+    return dict(row) if row else None
 
 
 def create_user_db(session: Session, user_data: dict) -> User:
     db_user = User(**user_data)  # ✅ CORRIGIDO: Criar instância com dados
     session.add(db_user)
     session.commit()
-    session.refresh(db_user)
     return db_user
 
 
 def get_users(
     session: Session, limit: int = 10, offset: int = 0
-) -> list[User]:
-    return session.scalars(select(User).limit(limit).offset(offset)).all()
+) -> list[dict]:
+    # Projeção de UserPublic pelo Core: sem identity map nem instâncias User
+    stmt = (
+        select(User.id, User.fullname, User.email, User.telephone)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [dict(row) for row in session.execute(stmt).mappings()]
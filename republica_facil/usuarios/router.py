@@ -1,11 +1,13 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from republica_facil.database import get_session
+from republica_facil.model.models import User
 from republica_facil.security import (
     get_current_user,
     get_password_hash,
@@ -14,9 +16,8 @@ from republica_facil.security import (
 
 from .repository import (
     create_user_db,
-    get_user_by_email,
+    email_exists,
     get_user_by_id,
-    get_user_by_telephone,
     get_users,
 )
 from .schema import (
@@ -36,13 +37,26 @@ from .service import (
 router = APIRouter(prefix='/users', tags=['users'])
 
 
-@router.post(
-    '/',
-    status_code=HTTPStatus.CREATED,
-    response_class=JSONResponse,
-    response_model=UserPublic,
-)
-def create_user(user: UserSchema, session=Depends(get_session)):
+def _user_public(db_user) -> dict:
+    """Monta o corpo de UserPublic direto do usuário do banco.
+
+    Os dados já vêm validados do banco; devolver um ORJSONResponse com este
+    dicionário evita a revalidação do response_model a cada requisição.
+    """
+    return {
+        'id': db_user.id,
+        'fullname': db_user.fullname,
+        'email': db_user.email,
+        'telephone': db_user.telephone,
+    }
+
+
+def _validate_new_user(user: UserSchema):
+    """Valida os dados do cadastro antes de qualquer hash ou acesso ao banco.
+
+    São checagens só de CPU e baratas: entradas inválidas falham aqui, sem
+    chegar ao Argon2 nem ao INSERT.
+    """
     if not verify_strong_password(user.password):
         raise HTTPException(
             status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail='Weak password'
@@ -58,49 +72,53 @@ def create_user(user: UserSchema, session=Depends(get_session)):
             status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
             detail='Enter your full name',
         )
-    existing_email = get_user_by_email(session, user.email)
-    if existing_email:
-        raise HTTPException(
-            detail='Email already exists',
-            status_code=HTTPStatus.CONFLICT,
-        )
 
-    existing_telephone = get_user_by_telephone(session, user.telephone)
-    if existing_telephone:
+
+@router.post(
+    '/',
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.CREATED: {'model': UserPublic}},
+)
+def create_user(user: UserSchema, session=Depends(get_session)):
+    _validate_new_user(user)
+
+    # Já validado pelo FastAPI: um único dump em vez de campo a campo
+    user_data = user.model_dump()
+    user_data['password'] = get_password_hash(user_data['password'])
+
+    # Sem SELECT prévio: as constraints UNIQUE decidem o conflito no INSERT
+    try:
+        db_user = create_user_db(session, user_data)
+    except IntegrityError:
+        session.rollback()
+        # Só no caminho de conflito: o email tem precedência sobre o telefone
+        field = 'Email' if email_exists(session, user.email) else 'Telephone'
         raise HTTPException(
-            detail='Telephone already exists',
+            detail=f'{field} already exists',
             status_code=HTTPStatus.CONFLICT,
         )
-    if not verify_strong_password(user.password):
-        raise HTTPException(
-            status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail='Weak password'
-        )
 
-    user_data = {
-        'fullname': user.fullname,
-        'email': user.email,
-        'telephone': user.telephone,
-        'password': get_password_hash(user.password),
-    }
+    return ORJSONResponse(
+        _user_public(db_user), status_code=HTTPStatus.CREATED
+    )
 
-    db_user = create_user_db(session, user_data)
 
-    return db_user
-
-
-@router.get('/', status_code=HTTPStatus.OK, response_model=UserList)
+@router.get(
+    '/',
+    status_code=HTTPStatus.OK,
+    responses={HTTPStatus.OK: {'model': UserList}},
+)
 def read_users(
     limit: int = 10, offset: int = 0, session: Session = Depends(get_session)
 ):
     users = get_users(session, limit, offset)
-    return {'users': users}
+    return ORJSONResponse({'users': users})
 
 
 @router.put(
     '/{user_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
-    response_model=UserPublic,
+    responses={HTTPStatus.OK: {'model': UserPublic}},
 )
 def update_user(
     user_id: int,
@@ -113,15 +131,22 @@ def update_user(
             status_code=HTTPStatus.FORBIDDEN, detail='Not enough permissions'
         )
 
-    try:
-        current_user.fullname = user.fullname
-        current_user.email = user.email
-        current_user.telephone = user.telephone
+    # Só os campos que mudaram; sem mudanças não há UPDATE nem commit
+    changes = {
+        field: value
+        for field, value in user.model_dump().items()
+        if getattr(current_user, field) != value
+    }
+    if not changes:
+        return ORJSONResponse(_user_public(current_user))
 
+    try:
+        session.execute(
+            update(User).where(User.id == user_id).values(**changes)
+        )
         session.commit()
-        session.refresh(current_user)
 
-        return current_user
+        return ORJSONResponse(_user_public(current_user))
 
     except IntegrityError:
         raise HTTPException(
@@ -133,7 +158,6 @@ def update_user(
 @router.patch(
     '/change-password/{user_id}',
     status_code=HTTPStatus.OK,
-    response_class=JSONResponse,
     response_model=Message,
 )
 def update_password(
@@ -169,7 +193,6 @@ def update_password(
 
     current_user.password = get_password_hash(user.new_password)
     session.commit()
-    session.refresh(current_user)
 
     return {'message': 'Senha alterada com sucesso'}
 
@@ -192,7 +215,7 @@ def delete_user(
     return {'message': 'User deleted'}
 
 
-@router.get('/{user_id}', response_model=UserPublic)
+@router.get('/{user_id}', responses={HTTPStatus.OK: {'model': UserPublic}})
 def read_user__exercicio(
     user_id: int, session: Session = Depends(get_session)
 ):
@@ -203,4 +226,4 @@ def read_user__exercicio(
             status_code=HTTPStatus.NOT_FOUND, detail='User not found'
         )
 
-    return db_user
+    return ORJSONResponse(db_user)
@@ -1,4 +1,23 @@
-import re
+def _ascii_class(c: str) -> str:
+    if c.isupper():
+        return 'U'
+    if c.islower():
+        return 'L'
+    if c.isdigit():
+        return 'D'
+    return 'S'
+
+
+# Senhas ASCII viram o alfabeto U/L/D/S num único str.translate em C
+_PASSWORD_CLASSES = str.maketrans({
+    chr(c): _ascii_class(chr(c)) for c in range(128)
+})
+_STRONG_PASSWORD_CLASSES = frozenset('ULDS')
+
+# Tabela de str.translate que apaga os caracteres ASCII que não são dígitos
+_ASCII_NON_DIGITS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
 
 
 def verify_strong_password(password: str) -> bool:
@@ -7,37 +26,52 @@ def verify_strong_password(password: str) -> bool:
     if len(password) < MIN_LEN:
         return False
 
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_special = any(not c.isalnum() for c in password)
-
-    return all([has_upper, has_lower, has_digit, has_special])
+    if password.isascii():
+        return _STRONG_PASSWORD_CLASSES <= frozenset(
+            password.translate(_PASSWORD_CLASSES)
+        )
+
+    # Uma única passada, classificando cada caractere uma vez
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        # Fora da cadeia: há letras com caixa que não são alfanuméricas
+        # (ex.: 'ⓐ'.islower() e not 'ⓐ'.isalnum()), e contam como especial
+        if not c.isalnum():
+            has_special = True
+        if has_upper and has_lower and has_digit and has_special:
+            return True
+
+    return False
 
 
 def verify_length_telephone(telephone: str) -> bool:
     MIN_TELEPHONE_ = 10
     MIN_TELEPHONE__ = 11
 
-    digits = re.sub(r'\D', '', telephone)
+    if telephone.isascii() and telephone.isdigit():
+        return MIN_TELEPHONE_ <= len(telephone) <= MIN_TELEPHONE__
+
+    if telephone.isascii():
+        digits = len(telephone.translate(_ASCII_NON_DIGITS))
+    else:
+        # Mesmo critério do \d do re: dígitos decimais Unicode
+        digits = sum(c.isdecimal() for c in telephone)
 
-    return MIN_TELEPHONE_ <= len(digits) <= MIN_TELEPHONE__
+    return MIN_TELEPHONE_ <= digits <= MIN_TELEPHONE__
 
 
 def verify_fullname(fullname: str) -> bool:
-    MIN_LEN_NAME = 3
+    # split() ignora espaços duplicados e nas pontas, e aceita tabs
+    names = fullname.split()
     MIN_NAMES = 2
+    MIN_NAME_LEN = 3
 
-    name_list = fullname.split(' ')
-
-    for name in name_list:
-        name.replace(name, name.strip())
-
-    if len(name_list) < MIN_NAMES:
-        return False
-
-    for n in name_list:
-        if len(n) < MIN_LEN_NAME:
-            return False
-
-    return True
+    return len(names) >= MIN_NAMES and all(
+        len(name) >= MIN_NAME_LEN for name in names
+    )
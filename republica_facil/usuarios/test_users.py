@@ -1,5 +1,7 @@
 from http import HTTPStatus
 
+from sqlalchemy import select
+
 from republica_facil.main import app
 from republica_facil.model.models import User
 from republica_facil.security import get_current_user, get_password_hash
@@ -58,7 +60,7 @@ def test_get_user(client, user):
     }
 
 
-def test_create_user(client):
+def test_create_user(client, session):
     response = client.post(
         '/users/',
         json={
@@ -69,8 +71,11 @@ def test_create_user(client):
         },
     )
     assert response.status_code == HTTPStatus.CREATED
+    user_id = session.scalar(
+        select(User.id).where(User.email == 'test@example.com')
+    )
     assert response.json() == {
-        'id': 1,
+        'id': user_id,
         'fullname': 'Test User',
         'email': 'test@example.com',
         'telephone': '11999999999',
@@ -118,7 +123,34 @@ def test_update_user(client, user):
             'telephone': '11888888888',
         }
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
+
+
+def test_update_user_without_changes(client, user):
+    def get_current_user_override():
+        return user
+
+    app.dependency_overrides[get_current_user] = get_current_user_override
+
+    try:
+        response = client.put(
+            f'/users/{user.id}',
+            json={
+                'fullname': user.fullname,
+                'email': user.email,
+                'telephone': user.telephone,
+            },
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            'id': user.id,
+            'fullname': 'Test User',
+            'email': 'testuser@example.com',
+            'telephone': '11999999999',
+        }
+    finally:
+        app.dependency_overrides.pop(get_current_user)
 
 
 # COLOCAR TOKEN NO CONFTEST
@@ -147,7 +179,7 @@ def test_update_user(client, user):
 #         assert response_update.status_code == HTTPStatus.CONFLICT
 #         assert response_update.json() == {'detail': 'Email already exists'}
 #     finally:
-#         app.dependency_overrides.clear()
+#         app.dependency_overrides.pop(get_current_user)
 
 
 def test_delete_user(client, user):
@@ -163,7 +195,7 @@ def test_delete_user(client, user):
         assert response.status_code == HTTPStatus.OK
         assert response.json() == {'message': 'User deleted'}
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_create_user_weak_password(client):
@@ -226,6 +258,21 @@ def test_create_user_telephone_already_exists(client, user):
     assert response.json()['detail'] == 'Telephone already exists'
 
 
+def test_create_user_email_conflict_takes_precedence(client, user, other_user):
+    """Email de um usuário e telefone de outro: o conflito de email vence."""
+    response = client.post(
+        '/users/',
+        json={
+            'fullname': 'New User',
+            'email': user.email,
+            'password': 'password123#S',
+            'telephone': other_user.telephone,
+        },
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()['detail'] == 'Email already exists'
+
+
 def test_update_user_forbidden(client, user, session):
     """Testa atualização de usuário sem permissão."""
     # Criar outro usuário para simular autenticação
@@ -258,7 +305,7 @@ def test_update_user_forbidden(client, user, session):
         assert response.status_code == HTTPStatus.FORBIDDEN
         assert response.json()['detail'] == 'Not enough permissions'
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_user_email_conflict(client, user, session):
@@ -292,7 +339,7 @@ def test_update_user_email_conflict(client, user, session):
         assert response.status_code == HTTPStatus.CONFLICT
         assert response.json()['detail'] == 'Email already exists'
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_password_success(client, user):
@@ -316,7 +363,7 @@ def test_update_password_success(client, user):
         assert response.status_code == HTTPStatus.OK
         assert response.json()['message'] == 'Senha alterada com sucesso'
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_password_forbidden(client, user, session):
@@ -349,7 +396,7 @@ def test_update_password_forbidden(client, user, session):
         assert response.status_code == HTTPStatus.FORBIDDEN
         assert response.json()['detail'] == 'Not enough permissions'
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_password_wrong_old_password(client, user):
@@ -373,7 +420,7 @@ def test_update_password_wrong_old_password(client, user):
         assert response.status_code == HTTPStatus.UNPROCESSABLE_CONTENT
         assert 'senha antiga' in response.json()['detail']
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_password_mismatch(client, user):
@@ -397,7 +444,7 @@ def test_update_password_mismatch(client, user):
         assert response.status_code == HTTPStatus.UNPROCESSABLE_CONTENT
         assert 'senhas devem ser iguais' in response.json()['detail']
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_update_password_weak_new_password(client, user):
@@ -421,7 +468,7 @@ def test_update_password_weak_new_password(client, user):
         assert response.status_code == HTTPStatus.UNPROCESSABLE_CONTENT
         assert 'Senha fraca' in response.json()['detail']
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)
 
 
 def test_delete_user_forbidden(client, user, session):
@@ -448,4 +495,4 @@ def test_delete_user_forbidden(client, user, session):
         assert response.status_code == HTTPStatus.FORBIDDEN
         assert response.json()['detail'] == 'Not enough permissions'
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_current_user)